@@ -5,31 +5,45 @@ StrengthTracker - A simple workout tracking app for Starting Strength.
 
 import yaml
 import click
+import csv
+import hashlib
+import heapq
+import json
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
+from functools import partial
 from pathlib import Path
 from rich.console import Console
 from rich.prompt import Prompt, Confirm
 from rich.panel import Panel
 from rich.table import Table
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 import sys
 
 console = Console()
+# Diagnostics go to stderr so report/query output on stdout stays machine-readable
+err_console = Console(stderr=True)
+# Use the libyaml parser for bulk reads when PyYAML was built with it
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 class StrengthTracker:
-    def __init__(self):
-        # Use user's home directory for data storage
-        self.data_dir = Path.home() / ".strength_tracker"
-        self.data_dir.mkdir(exist_ok=True)
+    def __init__(self, data_dir: Optional[Path] = None, create: bool = True):
+        # Use user's home directory for data storage unless an athlete directory is given
+        self.data_dir = Path(data_dir) if data_dir else Path.home() / ".strength_tracker"
         self.workouts_dir = self.data_dir / "workouts"
-        self.workouts_dir.mkdir(exist_ok=True)
+        # Batch commands read existing athletes only and never initialise new ones
+        self.create = create
+        if create:
+            self.data_dir.mkdir(parents=True, exist_ok=True)
+            self.workouts_dir.mkdir(exist_ok=True)
         
         # Load program configuration
         self.program = self.load_program()
         self.current_weights = self.load_weights()
         self.failure_streaks = self.load_failure_streaks()
         
-    def load_program(self) -> Dict:
+    @staticmethod
+    def load_program() -> Dict:
         """Load the Starting Strength program configuration from config.yaml."""
         config_file = Path("config.yaml")
         
@@ -54,8 +68,8 @@ class StrengthTracker:
                 return program
                 
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not load config.yaml: {e}[/yellow]")
-                console.print("[yellow]Using default configuration.[/yellow]")
+                err_console.print(f"[yellow]Warning: Could not load config.yaml: {e}[/yellow]")
+                err_console.print("[yellow]Using default configuration.[/yellow]")
         
         # Fallback to default configuration
         return {
@@ -136,14 +150,15 @@ class StrengthTracker:
                 with open(weights_file) as f:
                     return yaml.safe_load(f)
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not load weights file: {e}[/yellow]")
+                err_console.print(f"[yellow]Warning: Could not load weights file: {e}[/yellow]")
         
         # Initialize with starting weights
         weights = {}
         for exercise, config in self.program["exercises"].items():
             weights[exercise] = config["starting_weight"]
         
-        self.save_weights(weights)
+        if self.create:
+            self.save_weights(weights)
         return weights
     
     def load_failure_streaks(self) -> Dict:
@@ -155,14 +170,15 @@ class StrengthTracker:
                 with open(streaks_file) as f:
                     return yaml.safe_load(f)
             except Exception as e:
-                console.print(f"[yellow]Warning: Could not load failure streaks file: {e}[/yellow]")
+                err_console.print(f"[yellow]Warning: Could not load failure streaks file: {e}[/yellow]")
         
         # Initialize with empty streaks
         streaks = {}
         for exercise in self.program["exercises"].keys():
             streaks[exercise] = 0
         
-        self.save_failure_streaks(streaks)
+        if self.create:
+            self.save_failure_streaks(streaks)
         return streaks
     
     def save_failure_streaks(self, streaks: Dict):
@@ -192,16 +208,19 @@ class StrengthTracker:
     
     def get_current_workout(self) -> str:
         """Determine which workout is due today."""
-        today = datetime.now()
-        # Use a rolling 2-week cycle based on current date
+        return self.get_workout_for_date(datetime.now())
+    
+    def get_workout_for_date(self, day: datetime) -> str:
+        """Determine which workout template from the cycle falls on a given date."""
+        cycle = self.program.get("cycle") or list(self.program["workouts"].keys())
+        # Use a rolling cycle of weeks based on the date
         # This avoids the hardcoded 2024 issue
-        days_since_epoch = (today - datetime(1970, 1, 1)).days
-        week_number = days_since_epoch // 7
+        days_since_epoch = (day - datetime(1970, 1, 1)).days
+        # The epoch is a Thursday, shift by three days so weeks run Monday to Sunday
+        week_number = (days_since_epoch + 3) // 7
         
-        # Alternate between week A and B
-        return "week_A" if week_number % 2 == 0 else "week_B"
-    
-
+        # Step through the cycle one template per week (week A, week B, ...)
+        return cycle[week_number % len(cycle)]
     
     def get_workout_status(self) -> Dict:
         """Get workout status for today and this week."""
@@ -254,6 +273,292 @@ class StrengthTracker:
         
         return warmup_sets
     
+    def get_plan_cache_key(self, start: datetime) -> str:
+        """Hash everything a projected plan depends on, apart from its length."""
+        state = {
+            "program": self.program,
+            "weights": self.current_weights,
+            "start": start.strftime('%Y-%m-%d')
+        }
+        return hashlib.sha256(yaml.safe_dump(state, sort_keys=True).encode()).hexdigest()
+    
+    def load_plan_cache(self) -> Dict:
+        """Load the cached plan projection from file."""
+        cache_file = self.data_dir / "plan_cache.yaml"
+        
+        if cache_file.exists():
+            try:
+                with open(cache_file) as f:
+                    cache = yaml.safe_load(f)
+                if isinstance(cache, dict):
+                    return cache
+            except Exception as e:
+                err_console.print(f"[yellow]Warning: Could not load plan cache: {e}[/yellow]")
+        
+        return {}
+    
+    def save_plan_cache(self, cache: Dict):
+        """Save the plan projection to file."""
+        cache_file = self.data_dir / "plan_cache.yaml"
+        try:
+            with open(cache_file, 'w') as f:
+                yaml.dump(cache, f, sort_keys=False)
+        except Exception as e:
+            err_console.print(f"[red]Error saving plan cache: {e}[/red]")
+    
+    def project_plan(self, weeks: int = 4, start: Optional[datetime] = None) -> List[Dict]:
+        """Project upcoming sessions with expected weights and warmups.
+        
+        Sessions fall on the configured schedule days (1=Monday, 7=Sunday), take their
+        template from the cycle and assume every set is completed, so each lift
+        progresses once per session. The longest projection is cached in the data
+        directory and shorter ones are sliced from it, until the config, the
+        current weights or the start date change.
+        """
+        if start is None:
+            start = datetime.now()
+            if self.get_workout_status()["worked_out_today"]:
+                start += timedelta(days=1)
+        start = start.replace(hour=0, minute=0, second=0, microsecond=0)
+        end = (start + timedelta(days=weeks * 7)).strftime('%Y-%m-%d')
+        
+        cache_key = self.get_plan_cache_key(start)
+        cache = self.load_plan_cache()
+        if cache.get("key") == cache_key and cache.get("weeks", 0) >= weeks:
+            return [session for session in cache.get("sessions", []) if session["date"] < end]
+        
+        sessions = self.build_plan(start, weeks)
+        self.save_plan_cache({"key": cache_key, "weeks": weeks, "sessions": sessions})
+        return sessions
+    
+    def build_plan(self, start: datetime, weeks: int) -> List[Dict]:
+        """Project sessions from a start date without consulting the cache."""
+        schedule_days = self.program.get("schedule", {}).get("days", [2, 4, 7])
+        weights = {
+            exercise: self.current_weights.get(exercise, config["starting_weight"])
+            for exercise, config in self.program["exercises"].items()
+        }
+        
+        sessions = []
+        for offset in range(weeks * 7):
+            day = start + timedelta(days=offset)
+            if day.isoweekday() not in schedule_days:
+                continue
+            
+            workout = self.get_workout_for_date(day)
+            session = {
+                "date": day.strftime('%Y-%m-%d'),
+                "day": day.strftime('%A'),
+                "workout": workout,
+                "exercises": {}
+            }
+            
+            for exercise in self.program["workouts"][workout] + self.program["bonus_exercises"]:
+                exercise_config = self.program["exercises"][exercise]
+                weight = weights[exercise]
+                session["exercises"][exercise] = {
+                    "weight": weight,
+                    "sets": exercise_config["sets"],
+                    "reps": exercise_config["reps"],
+                    "warmup": self.get_warmup_sets(exercise, weight)
+                }
+                
+                # Assume a successful session and progress for the next one
+                if exercise_config["progression"] > 0 and weight != "bodyweight":
+                    weights[exercise] = self.round_weight(weight + exercise_config["progression"])
+            
+            sessions.append(session)
+        
+        return sessions
+    
+    def view_plan(self, weeks: int = 4):
+        """View the projected training plan for the coming weeks."""
+        console.print(f"[bold]Training Plan - next {weeks} weeks[/bold] [dim]({self.data_dir})[/dim]\n")
+        
+        sessions = self.project_plan(weeks)
+        if not sessions:
+            console.print("[yellow]No sessions scheduled.[/yellow]")
+            return
+        
+        table = Table()
+        table.add_column("Date")
+        table.add_column("Day")
+        table.add_column("Workout")
+        table.add_column("Exercise")
+        table.add_column("Working Sets")
+        table.add_column("Warmup")
+        
+        for session in sessions:
+            first = True
+            for exercise, ex_data in session["exercises"].items():
+                weight = ex_data["weight"]
+                weight_label = "Bodyweight" if weight == "bodyweight" else f"{weight} kg"
+                warmup = ", ".join(f"{w['weight']}×{w['reps']}" for w in ex_data["warmup"])
+                table.add_row(
+                    session["date"] if first else "",
+                    session["day"] if first else "",
+                    session["workout"] if first else "",
+                    exercise.replace('_', ' ').title(),
+                    f"{ex_data['sets']} × {ex_data['reps']} @ {weight_label}",
+                    warmup or "-"
+                )
+                first = False
+            table.add_section()
+        
+        console.print(table)
+    
+    def load_session_index(self) -> Dict:
+        """Load the exercise index of logged workouts from file."""
+        index_file = self.data_dir / "session_index.yaml"
+        
+        if index_file.exists():
+            try:
+                with open(index_file) as f:
+                    index = yaml.load(f, Loader=SafeLoader)
+                if isinstance(index, dict):
+                    return index
+            except Exception as e:
+                err_console.print(f"[yellow]Warning: Could not load session index: {e}[/yellow]")
+        
+        return {}
+    
+    def save_session_index(self, index: Dict):
+        """Save the exercise index of logged workouts to file."""
+        index_file = self.data_dir / "session_index.yaml"
+        try:
+            with open(index_file, 'w') as f:
+                yaml.dump(index, f)
+        except Exception as e:
+            err_console.print(f"[red]Error saving session index: {e}[/red]")
+    
+    def index_session(self, workout_file: Path, session: Dict):
+        """Record which exercises a freshly saved workout contains."""
+        index = self.load_session_index()
+        index[workout_file.name] = {
+            "mtime": workout_file.stat().st_mtime,
+            "exercises": session_exercises(session)
+        }
+        self.save_session_index(index)
+    
+    def find_session_files(self, exercises: Optional[Iterable[str]] = None,
+                           since: Optional[datetime] = None, until: Optional[datetime] = None) -> List[Path]:
+        """Find workout files that can match the given exercises and date range.
+        
+        Dates are read from the YYYY_MM_DD file names and exercises from the
+        session index, so non-matching files are never opened. Files missing from
+        the index, or changed since they were indexed, are indexed on the way.
+        Files with other names are always returned and need a date check once loaded.
+        The refreshed index is saved back to the data directory.
+        """
+        if isinstance(exercises, str):
+            exercises = [exercises]
+        
+        candidates = []
+        for workout_file in sorted(self.workouts_dir.glob("*.yaml")):
+            day = session_file_date(workout_file)  # None for unrecognised names
+            if day is not None and ((since and day < since) or (until and day > until)):
+                continue
+            candidates.append(workout_file)
+        
+        if not exercises:
+            return candidates
+        
+        index = self.load_session_index()
+        index_changed = False
+        wanted = set(exercises)
+        matches = []
+        
+        for workout_file in candidates:
+            mtime = workout_file.stat().st_mtime
+            entry = index.get(workout_file.name)
+            if not isinstance(entry, dict) or entry.get("mtime") != mtime or not isinstance(entry.get("exercises"), list):
+                entry = {"mtime": mtime, "exercises": session_exercises(load_session(workout_file) or {})}
+                index[workout_file.name] = entry
+                index_changed = True
+            
+            if wanted.intersection(entry["exercises"]):
+                matches.append(workout_file)
+        
+        # Drop entries for workouts that no longer exist
+        existing = {workout_file.name for workout_file in self.workouts_dir.glob("*.yaml")}
+        for name in list(index):
+            if name not in existing:
+                del index[name]
+                index_changed = True
+        
+        if index_changed:
+            self.save_session_index(index)
+        
+        return matches
+    
+    def query(self, exercises: Optional[List[str]] = None,
+              since: Optional[datetime] = None, until: Optional[datetime] = None,
+              min_weight: Optional[float] = None, max_weight: Optional[float] = None,
+              min_reps: Optional[int] = None, max_reps: Optional[int] = None,
+              failed: Optional[bool] = None) -> Iterator[Dict]:
+        """Stream logged sets matching the given filters, oldest first.
+        
+        Yields one result per exercise in a matching session, holding only the
+        sets that pass the weight, reps and failure filters. Bodyweight sets
+        never match a weight filter and sets without a rep count never match a
+        reps filter. Each file is loaded only when reached.
+        """
+        if isinstance(exercises, str):
+            exercises = [exercises]
+        wanted = set(exercises) if exercises else None
+        
+        for workout_file in self.find_session_files(wanted, since, until):
+            session = load_session(workout_file)
+            if session is None:
+                continue
+            
+            date = str(session.get("date") or workout_file.stem.replace("_", "-"))
+            if (since or until) and session_file_date(workout_file) is None:
+                # The file name gave no date, so check the one inside the session
+                try:
+                    day = datetime.strptime(date, '%Y-%m-%d')
+                except ValueError:
+                    continue
+                if (since and day < since) or (until and day > until):
+                    continue
+            
+            exercises_data = session.get("exercises")
+            for exercise, ex_data in (exercises_data.items() if isinstance(exercises_data, dict) else []):
+                if (wanted and exercise not in wanted) or not isinstance(ex_data, dict):
+                    continue
+                
+                matching_sets = []
+                for set_data in ex_data.get("sets") or []:
+                    if not isinstance(set_data, dict):
+                        continue
+                    
+                    weight = set_data.get("weight", ex_data.get("weight"))
+                    reps = set_data.get("actual_reps")
+                    
+                    if min_weight is not None or max_weight is not None:
+                        if not isinstance(weight, (int, float)):
+                            continue
+                        if (min_weight is not None and weight < min_weight) or (max_weight is not None and weight > max_weight):
+                            continue
+                    if min_reps is not None or max_reps is not None:
+                        if not isinstance(reps, (int, float)):
+                            continue
+                        if (min_reps is not None and reps < min_reps) or (max_reps is not None and reps > max_reps):
+                            continue
+                    if failed is not None and bool(set_data.get("failed", False)) != failed:
+                        continue
+                    
+                    matching_sets.append(set_data)
+                
+                if matching_sets:
+                    yield {
+                        "date": date,
+                        "workout": session.get("workout", "Unknown"),
+                        "exercise": exercise,
+                        "weight": ex_data.get("weight"),
+                        "sets": matching_sets
+                    }
+    
     def start_workout(self):
         """Start a workout session."""
         console.clear()
@@ -419,6 +724,7 @@ class StrengthTracker:
         # Save workout
         with open(filepath, 'w') as f:
             yaml.dump(workout_data, f)
+        self.index_session(filepath, workout_data)
         
         # Save updated weights and failure streaks
         self.save_weights(self.current_weights)
@@ -587,8 +893,263 @@ class StrengthTracker:
             elif choice == "q":
                 break
 
-@click.command()
-def main():
+def load_session(workout_file: Path) -> Optional[Dict]:
+    """Load a single logged workout, or None if it cannot be read."""
+    try:
+        with open(workout_file) as f:
+            session = yaml.load(f, Loader=SafeLoader)
+    except Exception as e:
+        err_console.print(f"[red]Error reading {workout_file}: {e}[/red]")
+        return None
+    
+    return session if isinstance(session, dict) else None
+
+def session_file_date(workout_file: Path) -> Optional[datetime]:
+    """Read the date from a YYYY_MM_DD workout file name, or None if it has another name."""
+    try:
+        return datetime.strptime(workout_file.stem, '%Y_%m_%d')
+    except ValueError:
+        return None
+
+def session_exercises(session: Dict) -> List[str]:
+    """List the exercise names logged in a session."""
+    exercises = session.get("exercises")
+    return sorted(exercises.keys()) if isinstance(exercises, dict) else []
+
+def iter_sessions(workouts_dir: Path) -> Iterator[Tuple[Path, Dict]]:
+    """Yield (path, session) for each logged workout, oldest first, one file at a time."""
+    for workout_file in sorted(workouts_dir.glob("*.yaml")):
+        session = load_session(workout_file)
+        if session is not None:
+            yield workout_file, session
+
+def iter_athlete_dirs(roots: Iterable[Path]) -> Iterator[Path]:
+    """Yield athlete data directories, either the roots themselves or their children."""
+    for root in roots:
+        root = Path(root)
+        if not root.is_dir():
+            err_console.print(f"[yellow]Warning: Skipping missing data directory {root}[/yellow]")
+            continue
+        
+        if (root / "workouts").is_dir():
+            yield root
+            continue
+        
+        for child in sorted(root.iterdir()):
+            if (child / "workouts").is_dir():
+                yield child
+
+def count_scheduled_sessions(start: datetime, end: datetime, schedule_days: List[int]) -> int:
+    """Count the scheduled training days between two dates, inclusive."""
+    total_days = (end - start).days + 1
+    if total_days <= 0:
+        return 0
+    
+    days = set(schedule_days)
+    full_weeks, remainder = divmod(total_days, 7)
+    count = full_weeks * len(days & set(range(1, 8)))
+    for offset in range(remainder):
+        if (start + timedelta(days=offset)).isoweekday() in days:
+            count += 1
+    return count
+
+def empty_summary() -> Dict:
+    """Create an empty partial report summary."""
+    return {
+        "athletes": [],
+        "sessions": 0,
+        "scheduled_sessions": 0,
+        "deloads": 0,
+        "tonnage": {},
+        "top_lifts": {}
+    }
+
+def lift_entry(weight: float, athlete: str, date: str) -> Tuple:
+    """Build a leaderboard entry that ranks heavier lifts first, then earlier dates."""
+    try:
+        ordinal = datetime.strptime(date, '%Y-%m-%d').toordinal()
+    except ValueError:
+        ordinal = datetime.max.toordinal()  # Undated lifts lose ties
+    return (weight, -ordinal, athlete, date)
+
+def merge_summaries(total: Dict, summary: Dict, top_k: int) -> Dict:
+    """Merge a partial report summary into a running total."""
+    total["athletes"].extend(summary["athletes"])
+    total["sessions"] += summary["sessions"]
+    total["scheduled_sessions"] += summary["scheduled_sessions"]
+    total["deloads"] += summary["deloads"]
+    
+    for exercise, tonnage in summary["tonnage"].items():
+        total["tonnage"][exercise] = total["tonnage"].get(exercise, 0) + tonnage
+    
+    # Keep a min-heap of the K heaviest lifts per exercise
+    for exercise, lifts in summary["top_lifts"].items():
+        heap = total["top_lifts"].setdefault(exercise, [])
+        for lift in lifts:
+            if len(heap) < top_k:
+                heapq.heappush(heap, lift)
+            elif lift > heap[0]:
+                heapq.heapreplace(heap, lift)
+    
+    return total
+
+def summarize_athlete(data_dir: Path, schedule_days: List[int], until: datetime) -> Dict:
+    """Stream one athlete's sessions into a partial report summary.
+    
+    Only running totals are kept, so memory does not grow with the number of
+    sessions. A deload is counted whenever a lift's working weight drops below
+    the weight used in the previous session.
+    """
+    athlete = data_dir.name
+    sessions = 0
+    deloads = 0
+    first_date = None
+    last_weights = {}
+    best_lifts = {}
+    tonnage = {}
+    
+    for workout_file, session in iter_sessions(data_dir / "workouts"):
+        # Collect the session on its own so a file that fails partway changes nothing
+        session_deloads = 0
+        session_weights = {}
+        session_best = {}
+        session_tonnage = {}
+        
+        try:
+            date = str(session.get("date") or workout_file.stem.replace("_", "-"))
+            exercises = session.get("exercises")
+            
+            for exercise, ex_data in (exercises.items() if isinstance(exercises, dict) else []):
+                if not isinstance(ex_data, dict):
+                    continue
+                
+                weight = ex_data.get("weight", 0)
+                if weight == "bodyweight" or not isinstance(weight, (int, float)):
+                    continue
+                
+                if exercise in last_weights and weight < last_weights[exercise]:
+                    session_deloads += 1
+                session_weights[exercise] = weight
+                
+                sets = ex_data.get("sets")
+                for set_data in (sets if isinstance(sets, list) else []):
+                    if not isinstance(set_data, dict):
+                        continue
+                    
+                    set_weight = set_data.get("weight", weight)
+                    reps = set_data.get("actual_reps")
+                    if not isinstance(set_weight, (int, float)) or not isinstance(reps, (int, float)) or reps <= 0:
+                        continue
+                    
+                    session_tonnage[exercise] = session_tonnage.get(exercise, 0) + set_weight * reps
+                    if not set_data.get("failed", False) and set_weight > session_best.get(exercise, 0):
+                        session_best[exercise] = set_weight
+        except Exception as e:
+            err_console.print(f"[red]Error reading {workout_file}: {e}[/red]")
+            continue
+        
+        sessions += 1
+        deloads += session_deloads
+        last_weights.update(session_weights)
+        for exercise, value in session_tonnage.items():
+            tonnage[exercise] = tonnage.get(exercise, 0) + value
+        for exercise, weight in session_best.items():
+            # Strictly heavier only, so the earliest date keeps a tied best
+            if weight > best_lifts.get(exercise, (0, ""))[0]:
+                best_lifts[exercise] = (weight, date)
+        if first_date is None:
+            first_date = date
+    
+    scheduled = 0
+    if first_date is not None:
+        try:
+            scheduled = count_scheduled_sessions(datetime.strptime(first_date, '%Y-%m-%d'), until, schedule_days)
+        except ValueError:
+            err_console.print(f"[yellow]Warning: Unrecognised date {first_date} for {athlete}[/yellow]")
+    
+    return {
+        "athletes": [{
+            "athlete": athlete,
+            "sessions": sessions,
+            "scheduled_sessions": scheduled,
+            "adherence": round(sessions / scheduled, 3) if scheduled else None,
+            "deloads": deloads,
+            "tonnage": round(sum(tonnage.values()), 1)
+        }],
+        "sessions": sessions,
+        "scheduled_sessions": scheduled,
+        "deloads": deloads,
+        "tonnage": tonnage,
+        "top_lifts": {
+            exercise: [lift_entry(weight, athlete, date)]
+            for exercise, (weight, date) in best_lifts.items()
+        }
+    }
+
+def build_report(roots: Iterable[Path], schedule_days: List[int], top_k: int = 10,
+                 workers: int = 1, until: Optional[datetime] = None) -> Dict:
+    """Aggregate every athlete under the given roots into a gym-wide report."""
+    until = until or datetime.now()
+    summarize = partial(summarize_athlete, schedule_days=schedule_days, until=until)
+    total = empty_summary()
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for summary in executor.map(summarize, iter_athlete_dirs(roots), chunksize=16):
+                merge_summaries(total, summary, top_k)
+    else:
+        for summary in map(summarize, iter_athlete_dirs(roots)):
+            merge_summaries(total, summary, top_k)
+    
+    return {
+        "generated": datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+        "until": until.strftime('%Y-%m-%d'),
+        "athletes": len(total["athletes"]),
+        "sessions": total["sessions"],
+        "scheduled_sessions": total["scheduled_sessions"],
+        "adherence": round(total["sessions"] / total["scheduled_sessions"], 3) if total["scheduled_sessions"] else None,
+        "deloads": total["deloads"],
+        "deload_rate": round(total["deloads"] / total["sessions"], 3) if total["sessions"] else None,
+        "tonnage": {exercise: round(value, 1) for exercise, value in sorted(total["tonnage"].items())},
+        "top_lifts": {
+            exercise: [
+                {"rank": rank, "athlete": athlete, "weight": weight, "date": date}
+                for rank, (weight, _, athlete, date) in enumerate(sorted(heap, reverse=True), 1)
+            ]
+            for exercise, heap in sorted(total["top_lifts"].items())
+        },
+        "members": sorted(total["athletes"], key=lambda row: row["athlete"])
+    }
+
+def write_report_csv(report: Dict, out):
+    """Write a report as CSV, one metric per row."""
+    writer = csv.writer(out)
+    writer.writerow(["metric", "exercise", "rank", "athlete", "date", "value"])
+    
+    for exercise, lifts in report["top_lifts"].items():
+        for lift in lifts:
+            writer.writerow(["top_lift", exercise, lift["rank"], lift["athlete"], lift["date"], lift["weight"]])
+    
+    for exercise, tonnage in report["tonnage"].items():
+        writer.writerow(["tonnage", exercise, "", "", "", tonnage])
+    
+    for member in report["members"]:
+        for metric in ["sessions", "scheduled_sessions", "adherence", "deloads", "tonnage"]:
+            value = member[metric]
+            writer.writerow([f"athlete_{metric}", "", "", member["athlete"], "", "" if value is None else value])
+    
+    for metric in ["athletes", "sessions", "scheduled_sessions", "adherence", "deloads", "deload_rate"]:
+        value = report[metric]
+        writer.writerow([f"gym_{metric}", "", "", "", report["until"], "" if value is None else value])
+
+def write_report_json(report: Dict, out):
+    """Write a report as JSON."""
+    json.dump(report, out, indent=2)
+    out.write("\n")
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def main(ctx):
     """Run the StrengthTracker application."""
     # Check dependencies
     try:
@@ -600,6 +1161,9 @@ def main():
         console.print("Please install dependencies with: pip install click rich pyyaml")
         sys.exit(1)
     
+    if ctx.invoked_subcommand is not None:
+        return
+    
     try:
         StrengthTracker().run()
     except KeyboardInterrupt:
@@ -608,5 +1172,95 @@ def main():
         console.print(f"\n[red bold]Error:[/red bold] {str(e)}")
         console.print("\nIf this is a data corruption issue, try deleting the .strength_tracker directory in your home folder.")
 
+@main.command()
+@click.option("--weeks", default=4, show_default=True, type=click.IntRange(min=1), help="Number of weeks to project.")
+@click.option("--data-dir", "data_dirs", multiple=True, type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Athlete data directory (repeatable). Defaults to ~/.strength_tracker.")
+def plan(weeks, data_dirs):
+    """Project the coming training sessions for one or more athletes."""
+    if not data_dirs:
+        default_dir = Path.home() / ".strength_tracker"
+        if not default_dir.is_dir():
+            raise click.UsageError(f"No athlete data found at {default_dir}. Log a workout first or pass --data-dir.")
+        data_dirs = [default_dir]
+    
+    for data_dir in data_dirs:
+        try:
+            StrengthTracker(data_dir, create=False).view_plan(weeks)
+        except Exception as e:
+            console.print(f"[red]Error projecting plan for {data_dir}: {e}[/red]")
+        console.print()
+
+@main.command()
+@click.argument("roots", nargs=-1, type=click.Path(exists=True, file_okay=False, path_type=Path))
+@click.option("--top", "top_k", default=10, show_default=True, type=click.IntRange(min=1), help="Entries per exercise leaderboard.")
+@click.option("--workers", default=1, show_default=True, type=click.IntRange(min=1), help="Worker processes.")
+@click.option("--format", "output_format", default="json", show_default=True, type=click.Choice(["json", "csv"]))
+@click.option("--output", default="-", type=click.File("w"), help="Output file. Defaults to stdout.")
+def report(roots, top_k, workers, output_format, output):
+    """Build a gym-wide report across athlete data directories.
+    
+    Each ROOT is either an athlete data directory or a directory containing them.
+    """
+    program = StrengthTracker.load_program()
+    schedule_days = program.get("schedule", {}).get("days", [2, 4, 7])
+    
+    result = build_report(roots or [Path.home() / ".strength_tracker"], schedule_days, top_k, workers)
+    
+    if output_format == "csv":
+        write_report_csv(result, output)
+    else:
+        write_report_json(result, output)
+
+@main.command()
+@click.option("--exercise", "exercises", multiple=True, help="Exercise to include (repeatable).")
+@click.option("--since", type=click.DateTime(formats=["%Y-%m-%d"]), help="First date to include.")
+@click.option("--until", type=click.DateTime(formats=["%Y-%m-%d"]), help="Last date to include.")
+@click.option("--min-weight", type=float, help="Minimum set weight in kg.")
+@click.option("--max-weight", type=float, help="Maximum set weight in kg.")
+@click.option("--min-reps", type=int, help="Minimum reps completed.")
+@click.option("--max-reps", type=int, help="Maximum reps completed.")
+@click.option("--failed/--succeeded", default=None, help="Only failed or only successful sets.")
+@click.option("--format", "output_format", default="csv", show_default=True, type=click.Choice(["csv", "jsonl"]))
+@click.option("--data-dir", type=click.Path(exists=True, file_okay=False, path_type=Path),
+              help="Athlete data directory. Defaults to ~/.strength_tracker.")
+def query(exercises, since, until, min_weight, max_weight, min_reps, max_reps, failed, output_format, data_dir):
+    """Query logged sets by exercise, date, weight, reps and failure."""
+    data_dir = data_dir or Path.home() / ".strength_tracker"
+    if not data_dir.is_dir():
+        raise click.UsageError(f"No athlete data found at {data_dir}. Log a workout first or pass --data-dir.")
+    
+    results = StrengthTracker(data_dir, create=False).query(
+        exercises=list(exercises) or None,
+        since=since,
+        until=until,
+        min_weight=min_weight,
+        max_weight=max_weight,
+        min_reps=min_reps,
+        max_reps=max_reps,
+        failed=failed
+    )
+    
+    out = sys.stdout
+    if output_format == "jsonl":
+        for result in results:
+            out.write(json.dumps(result) + "\n")
+        return
+    
+    writer = csv.writer(out)
+    writer.writerow(["date", "workout", "exercise", "set", "weight", "target_reps", "actual_reps", "failed"])
+    for result in results:
+        for set_data in result["sets"]:
+            writer.writerow([
+                result["date"],
+                result["workout"],
+                result["exercise"],
+                set_data.get("set"),
+                set_data.get("weight", result["weight"]),
+                set_data.get("target_reps"),
+                set_data.get("actual_reps"),
+                set_data.get("failed", False)
+            ])
+
 if __name__ == '__main__':
     main() 
\ No newline at end of file
@@ -0,0 +1,52 @@
+import pytest
+import yaml
+
+from strength_tracker.strength_tracker import StrengthTracker
+
+
+@pytest.fixture(autouse=True)
+def isolated_environment(tmp_path, monkeypatch):
+    """Keep tests away from the real home directory and any local config.yaml."""
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+    monkeypatch.chdir(tmp_path)
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    return StrengthTracker(tmp_path / "athlete")
+
+
+@pytest.fixture
+def make_lift():
+    """Build a logged exercise entry with one set per entry in ``reps``."""
+
+    def make(weight, reps=(5, 5, 5)):
+        return {
+            "weight": weight,
+            "sets": [
+                {
+                    "set": i + 1,
+                    "weight": weight,
+                    "target_reps": 5,
+                    "actual_reps": r,
+                    "failed": isinstance(r, int) and r < 5,
+                }
+                for i, r in enumerate(reps)
+            ],
+        }
+
+    return make
+
+
+@pytest.fixture
+def write_session():
+    """Write a workout file, named after its date unless ``name`` is given."""
+
+    def write(workouts_dir, day, exercises, name=None):
+        workouts_dir.mkdir(parents=True, exist_ok=True)
+        session = {"date": day, "workout": "week_A", "exercises": exercises}
+        path = workouts_dir / f"{name or day.replace('-', '_')}.yaml"
+        path.write_text(yaml.dump(session))
+        return path
+
+    return write
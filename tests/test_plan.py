@@ -0,0 +1,65 @@
+from datetime import datetime
+
+import yaml
+
+from strength_tracker.strength_tracker import StrengthTracker
+
+MONDAY = datetime(2026, 10, 19)
+
+
+def test_weeks_run_monday_to_sunday(tracker):
+    week = [tracker.get_workout_for_date(datetime(2026, 10, 19 + i)) for i in range(7)]
+    assert len(set(week)) == 1
+    assert tracker.get_workout_for_date(datetime(2026, 10, 26)) != week[0]
+    assert tracker.get_workout_for_date(datetime(2026, 11, 2)) == week[0]
+
+
+def test_project_plan_dates_templates_and_progression(tracker):
+    sessions = tracker.project_plan(weeks=2, start=MONDAY)
+
+    assert [s["date"] for s in sessions] == [
+        "2026-10-20", "2026-10-22", "2026-10-25",
+        "2026-10-27", "2026-10-29", "2026-11-01",
+    ]
+    assert {s["workout"] for s in sessions[:3]} == {tracker.get_workout_for_date(MONDAY)}
+    assert sessions[3]["workout"] != sessions[0]["workout"]
+
+    squats = [s["exercises"]["squat"]["weight"] for s in sessions]
+    assert squats == [60, 62.5, 65, 67.5, 70, 72.5]
+
+    first = sessions[0]["exercises"]
+    assert [w["reps"] for w in first["squat"]["warmup"]] == [5, 3, 1]
+    assert first["atlas_curl"]["weight"] == "bodyweight"
+    assert first["atlas_curl"]["warmup"] == []
+
+
+def test_project_plan_reuses_cache_for_shorter_horizons(tracker, monkeypatch):
+    long_plan = tracker.project_plan(weeks=4, start=MONDAY)
+
+    def fail(*args):
+        raise AssertionError("plan was rebuilt")
+
+    monkeypatch.setattr(tracker, "build_plan", fail)
+    assert tracker.project_plan(weeks=4, start=MONDAY) == long_plan
+    assert tracker.project_plan(weeks=2, start=MONDAY) == long_plan[:6]
+
+
+def test_project_plan_cache_invalidated_when_weights_change(tracker):
+    tracker.project_plan(weeks=1, start=MONDAY)
+    tracker.current_weights["squat"] = 100
+
+    sessions = tracker.project_plan(weeks=1, start=MONDAY)
+    assert sessions[0]["exercises"]["squat"]["weight"] == 100
+
+
+def test_project_plan_ignores_malformed_cache(tracker):
+    (tracker.data_dir / "plan_cache.yaml").write_text(yaml.dump(["not", "a", "mapping"]))
+    assert len(tracker.project_plan(weeks=1, start=MONDAY)) == 3
+
+
+def test_read_only_tracker_does_not_create_athlete(tmp_path):
+    data_dir = tmp_path / "missing"
+    tracker = StrengthTracker(data_dir, create=False)
+
+    assert not data_dir.exists()
+    assert tracker.current_weights["squat"] == 60
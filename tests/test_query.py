@@ -0,0 +1,90 @@
+import os
+from datetime import datetime
+
+import strength_tracker.strength_tracker as st
+
+
+def count_loads(monkeypatch):
+    loaded = []
+    original = st.load_session
+
+    def tracking_load(workout_file):
+        loaded.append(workout_file.name)
+        return original(workout_file)
+
+    monkeypatch.setattr(st, "load_session", tracking_load)
+    return loaded
+
+
+def test_query_filters_sets(tracker, write_session, make_lift):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100, (5, 5, 3)), "bench_press": make_lift(60)})
+    write_session(tracker.workouts_dir, "2026-10-22", {"squat": make_lift(90, (5, 4, 5))})
+
+    results = list(tracker.query(exercises=["squat"], min_weight=100, failed=True))
+
+    assert len(results) == 1
+    assert results[0]["date"] == "2026-10-20"
+    assert [s["set"] for s in results[0]["sets"]] == [3]
+
+
+def test_query_accepts_single_exercise_string(tracker, write_session, make_lift):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100), "bench_press": make_lift(60)})
+
+    results = list(tracker.query(exercises="squat"))
+
+    assert [r["exercise"] for r in results] == ["squat"]
+
+
+def test_query_reps_filter_skips_missing_reps(tracker, write_session, make_lift):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100, (5, None, 5))})
+    write_session(tracker.workouts_dir, "2026-10-22", {"squat": {"weight": 100, "sets": [{"set": 1, "weight": 100}]}})
+
+    assert [s["set"] for r in tracker.query(min_reps=1) for s in r["sets"]] == [1, 3]
+    assert [s["set"] for r in tracker.query(max_reps=5) for s in r["sets"]] == [1, 3]
+    assert list(tracker.query(max_reps=3)) == []
+
+
+def test_query_skips_malformed_exercises(tracker, write_session, make_lift):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": [1, 2], "bench_press": make_lift(60)})
+
+    results = list(tracker.query())
+
+    assert [r["exercise"] for r in results] == ["bench_press"]
+
+
+def test_query_checks_session_date_for_unrecognised_file_names(tracker, write_session, make_lift):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(tracker.workouts_dir, "2026-03-01", {"squat": make_lift(80)}, name="imported")
+
+    results = list(tracker.query(since=datetime(2026, 10, 1)))
+
+    assert [r["date"] for r in results] == ["2026-10-20"]
+
+
+def test_find_session_files_does_not_open_non_matching_files(tracker, write_session, make_lift, monkeypatch):
+    write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(tracker.workouts_dir, "2026-10-22", {"bench_press": make_lift(60)})
+    write_session(tracker.workouts_dir, "2026-09-01", {"bench_press": make_lift(55)})
+
+    # Build the index, then only the matching file should ever be opened
+    tracker.find_session_files(exercises=["bench_press"])
+    loaded = count_loads(monkeypatch)
+
+    results = list(tracker.query(exercises=["bench_press"], since=datetime(2026, 10, 1)))
+
+    assert [r["date"] for r in results] == ["2026-10-22"]
+    assert loaded == ["2026_10_22.yaml"]
+
+
+def test_find_session_files_reindexes_changed_files(tracker, write_session, make_lift, monkeypatch):
+    path = write_session(tracker.workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    assert tracker.find_session_files(exercises=["bench_press"]) == []
+
+    write_session(tracker.workouts_dir, "2026-10-20", {"bench_press": make_lift(60)})
+    stat = path.stat()
+    os.utime(path, (stat.st_atime, stat.st_mtime + 10))
+    loaded = count_loads(monkeypatch)
+
+    assert tracker.find_session_files(exercises=["bench_press"]) == [path]
+    assert loaded == ["2026_10_20.yaml"]
+    assert tracker.load_session_index()["2026_10_20.yaml"]["exercises"] == ["bench_press"]
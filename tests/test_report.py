@@ -0,0 +1,128 @@
+from datetime import datetime
+
+import strength_tracker.strength_tracker as st
+from strength_tracker.strength_tracker import (
+    build_report,
+    count_scheduled_sessions,
+    empty_summary,
+    lift_entry,
+    merge_summaries,
+    summarize_athlete,
+)
+
+SCHEDULE = [2, 4, 7]
+
+
+def test_count_scheduled_sessions():
+    monday = datetime(2026, 10, 19)
+    assert count_scheduled_sessions(monday, datetime(2026, 10, 25), SCHEDULE) == 3
+    assert count_scheduled_sessions(monday, datetime(2026, 11, 1), SCHEDULE) == 6
+    assert count_scheduled_sessions(monday, datetime(2026, 10, 20), SCHEDULE) == 1
+    assert count_scheduled_sessions(monday, monday, SCHEDULE) == 0
+    assert count_scheduled_sessions(datetime(2026, 10, 20), monday, SCHEDULE) == 0
+
+
+def summary_with(lifts):
+    summary = empty_summary()
+    summary["top_lifts"] = {"squat": [lift_entry(*lift) for lift in lifts]}
+    return summary
+
+
+def test_merge_summaries_keeps_top_k_with_earliest_ties():
+    lifts = [
+        (100, "alice", "2026-10-22"),
+        (100, "bob", "2026-10-20"),
+        (100, "carol", "2026-10-21"),
+        (90, "dave", "2026-10-01"),
+    ]
+
+    forward = empty_summary()
+    for lift in lifts:
+        merge_summaries(forward, summary_with([lift]), top_k=2)
+    backward = empty_summary()
+    for lift in reversed(lifts):
+        merge_summaries(backward, summary_with([lift]), top_k=2)
+
+    assert sorted(forward["top_lifts"]["squat"]) == sorted(backward["top_lifts"]["squat"])
+    assert [entry[2] for entry in sorted(forward["top_lifts"]["squat"], reverse=True)] == ["bob", "carol"]
+
+
+def test_summarize_athlete_counts_deloads_and_best_lift(tmp_path, write_session, make_lift):
+    workouts_dir = tmp_path / "alice" / "workouts"
+    write_session(workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(workouts_dir, "2026-10-22", {"squat": make_lift(102.5, reps=(5, 5, 3))})
+    write_session(workouts_dir, "2026-10-25", {"squat": make_lift(92.5)})
+
+    summary = summarize_athlete(tmp_path / "alice", SCHEDULE, datetime(2026, 10, 25))
+
+    assert summary["sessions"] == 3
+    assert summary["scheduled_sessions"] == 3
+    assert summary["deloads"] == 1
+    assert summary["top_lifts"]["squat"] == [lift_entry(102.5, "alice", "2026-10-22")]
+    assert summary["tonnage"]["squat"] == 100 * 15 + 102.5 * 13 + 92.5 * 15
+
+
+def test_summarize_athlete_skips_malformed_sessions(tmp_path, write_session, make_lift):
+    workouts_dir = tmp_path / "alice" / "workouts"
+    write_session(workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(workouts_dir, "2026-10-22", {"squat": [1, 2]})
+    write_session(workouts_dir, "2026-10-25", {"squat": {"weight": 100, "sets": [{"weight": 100, "actual_reps": None}]}})
+    (workouts_dir / "2026_10_27.yaml").write_text("exercises: [unclosed")
+
+    summary = summarize_athlete(tmp_path / "alice", SCHEDULE, datetime(2026, 10, 27))
+
+    assert summary["sessions"] == 3
+    assert summary["tonnage"]["squat"] == 100 * 15
+
+
+def test_summarize_athlete_counts_whole_session_or_nothing(tmp_path, write_session, make_lift):
+    workouts_dir = tmp_path / "alice" / "workouts"
+    write_session(workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(workouts_dir, "2026-10-22", {"bench_press": make_lift(20), "squat": {"weight": 90, "sets": 5}})
+
+    summary = summarize_athlete(tmp_path / "alice", SCHEDULE, datetime(2026, 10, 22))
+
+    # The malformed squat sets are ignored, the rest of the session counts
+    assert summary["sessions"] == 2
+    assert summary["deloads"] == 1
+    assert summary["tonnage"] == {"squat": 100 * 15, "bench_press": 20 * 15}
+
+
+def test_summarize_athlete_drops_session_that_fails_partway(tmp_path, write_session, make_lift, monkeypatch):
+    workouts_dir = tmp_path / "alice" / "workouts"
+    write_session(workouts_dir, "2026-10-20", {"squat": make_lift(100)})
+    write_session(workouts_dir, "2026-10-22", {"bench_press": make_lift(20), "squat": make_lift(90)})
+
+    class ExplodingWeight(float):
+        def __lt__(self, other):
+            raise ValueError("bad weight")
+
+    original = st.load_session
+
+    def load(workout_file):
+        session = original(workout_file)
+        if workout_file.name == "2026_10_22.yaml":
+            session["exercises"]["squat"]["weight"] = ExplodingWeight(90)
+        return session
+
+    monkeypatch.setattr(st, "load_session", load)
+    summary = summarize_athlete(tmp_path / "alice", SCHEDULE, datetime(2026, 10, 22))
+
+    assert summary["sessions"] == 1
+    assert summary["deloads"] == 0
+    assert summary["tonnage"] == {"squat": 100 * 15}
+    assert "bench_press" not in summary["top_lifts"]
+
+
+def test_build_report_skips_missing_roots(tmp_path, write_session, make_lift):
+    write_session(tmp_path / "gym" / "alice" / "workouts", "2026-10-20", {"squat": make_lift(100)})
+    write_session(tmp_path / "gym" / "bob" / "workouts", "2026-10-20", {"squat": make_lift(120)})
+
+    report = build_report(
+        [tmp_path / "gym", tmp_path / "missing"], SCHEDULE, top_k=1, until=datetime(2026, 10, 25)
+    )
+
+    assert report["athletes"] == 2
+    assert report["top_lifts"]["squat"] == [
+        {"rank": 1, "athlete": "bob", "weight": 120, "date": "2026-10-20"}
+    ]